@@ -6,14 +6,180 @@ Advanced graphical interface for SQLMap commands with modern dark theme
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
-import subprocess
+import tkinter.font as tkfont
+import asyncio
+import codecs
+import io
+import shlex
+import shutil
 import threading
 import json
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Prefer orjson for reading and writing presets when it is installed
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Maximum number of lines kept in the output display; the full output
+# is kept separately for Save Output
+MAX_OUTPUT_LINES = 5000
+
+# Interval in milliseconds between output display updates
+OUTPUT_POLL_INTERVAL = 30
+
+# Number of bytes read from the SQLMap pipe at a time
+READ_CHUNK_SIZE = 65536
+
+# Seconds to wait for SQLMap to exit after terminate() before killing it
+TERMINATE_GRACE_PERIOD = 3.0
+
+# Maximum number of generated commands remembered by _refresh_command
+COMMAND_CACHE_SIZE = 32
+
+# Number of characters after which a display update stops taking
+# queued chunks, so a burst of output is spread over several updates
+MAX_CHARS_PER_FLUSH = 65536
+
+# Maximum number of chunks waiting for display; older ones are dropped
+# from the display (never from the saved output) when Tk falls behind
+MAX_DISPLAY_BACKLOG = 256
+
+# User presets file
+PRESETS_FILE = os.path.join(os.path.expanduser("~"), ".sqlmap_gui_presets.json")
+
+# Built-in presets used when no presets file exists
+DEFAULT_PRESETS = {
+    "🚀 Quick Scan": {
+        "risk": "2",
+        "level": "3",
+        "batch": True,
+        "verbose": True,
+        "random_agent": True
+    },
+    "🔍 Comprehensive Scan": {
+        "risk": "3",
+        "level": "5",
+        "threads": "10",
+        "batch": True,
+        "verbose": True,
+        "enum_dbs": True,
+        "enum_tables": True,
+        "enum_columns": True,
+        "random_agent": True
+    },
+    "📊 Database Enumeration": {
+        "risk": "2",
+        "level": "3",
+        "batch": True,
+        "enum_dbs": True,
+        "enum_tables": True,
+        "enum_columns": True,
+        "verbose": True
+    },
+    "💾 Data Extraction": {
+        "risk": "3",
+        "level": "4",
+        "batch": True,
+        "dump_all": True,
+        "verbose": True,
+        "random_agent": True
+    },
+    "🎯 Stealth Mode": {
+        "risk": "1",
+        "level": "2",
+        "delay": "2",
+        "batch": True,
+        "tor": True,
+        "random_agent": True
+    },
+    "⚡ Aggressive Scan": {
+        "risk": "3",
+        "level": "5",
+        "threads": "15",
+        "batch": True,
+        "verbose": True,
+        "enum_dbs": True,
+        "enum_tables": True,
+        "enum_columns": True,
+        "dump_all": True
+    }
+}
+
 class SQLMapGUI:
+    # Separator line used in output banners
+    _SEP = "=" * 80 + "\n"
+    
+    # Options taking a separate value argument
+    _VALUE_FLAGS = (
+        ("url_var", "-u"),
+        ("data_var", "--data"),
+        ("cookie_var", "--cookie"),
+        ("user_agent_var", "--user-agent"),
+        ("referer_var", "--referer"),
+        ("headers_var", "--headers"),
+        ("proxy_var", "--proxy"),
+        ("database_var", "-D"),
+        ("table_var", "-T"),
+        ("wordlist_var", "--wordlist"),
+        ("output_dir_var", "--output-dir")
+    )
+    
+    # Options only emitted when changed from their default
+    _NUMERIC_FLAGS = (
+        ("risk_var", "--risk=", "1"),
+        ("level_var", "--level=", "1"),
+        ("threads_var", "--threads=", "1"),
+        ("timeout_var", "--timeout=", "30"),
+        ("retries_var", "--retries=", "3"),
+        ("delay_var", "--delay=", "0")
+    )
+    
+    # Boolean switches
+    _BOOL_FLAGS = (
+        ("tor_var", "--tor"),
+        ("random_agent_var", "--random-agent"),
+        ("batch_var", "--batch"),
+        ("verbose_var", "-v"),
+        ("enum_dbs_var", "--dbs"),
+        ("enum_tables_var", "--tables"),
+        ("enum_columns_var", "--columns"),
+        ("enum_schema_var", "--schema"),
+        ("dump_all_var", "--dump-all"),
+        ("dump_table_var", "--dump"),
+        ("dump_columns_var", "--dump-columns"),
+        ("count_var", "--count"),
+        ("common_tables_var", "--common-tables"),
+        ("common_columns_var", "--common-columns"),
+        ("os_detect_var", "--os-detect"),
+        ("dbms_detect_var", "--dbms-detect")
+    )
+    
+    # Injection technique letters for --technique
+    _TECH_MAP = (
+        ("tech_boolean_var", "B"),
+        ("tech_error_var", "E"),
+        ("tech_union_var", "U"),
+        ("tech_stacked_var", "S"),
+        ("tech_time_var", "T"),
+        ("tech_inline_var", "Q")
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🔒 SQLMap Professional - Advanced SQL Injection Scanner")
@@ -23,8 +189,30 @@ class SQLMapGUI:
         
         # Variables
         self.current_command = ""
+        self.current_argv = ()
         self.is_running = False
-        self.output_buffer = ""
+        self._process = None
+        self._stop_requested = False
+        self._output_log = io.StringIO()
+        self._output_lock = threading.Lock()
+        self._display_chunks = deque(maxlen=MAX_DISPLAY_BACKLOG)
+        # Chunks dropped from the full backlog (loop thread) and how many
+        # of those the display has already marked (Tk thread)
+        self._display_dropped = 0
+        self._display_dropped_shown = 0
+        self._regen_id = None
+        self._regen_pending = False
+        self._pump_id = None
+        self._command_signature = None
+        self._command_cache = {}
+        self._status_reset_id = None
+        
+        # Background event loop driving the SQLMap subprocess
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        
+        # Single worker so preset writes land on disk in the order they were made
+        self._preset_writer = ThreadPoolExecutor(max_workers=1)
         
         # Professional color scheme
         self.colors = {
@@ -43,87 +231,166 @@ class SQLMapGUI:
             'error': '#ff4757'
         }
         
+        # Shared fonts
+        self.create_fonts()
+        
         # Style configuration
         self.setup_styles()
         
-        # Create main interface
-        self.create_interface()
+        # Option variables shared by the tabs, presets and command builder
+        self.create_variables()
+        
+        # Create main interface with the window hidden so geometry is
+        # computed once instead of after every widget
+        self.root.withdraw()
+        try:
+            self.create_interface()
+        finally:
+            self.root.update_idletasks()
+            self.root.deiconify()
+        
+        # Keep the command preview in sync with the options
+        self.bind_option_traces()
         
         # Load presets
         self.load_presets()
     
+    def create_fonts(self):
+        """Create the named fonts shared by all widgets"""
+        self.fonts = {
+            'ui': tkfont.Font(family='Segoe UI', size=9),
+            'ui_bold': tkfont.Font(family='Segoe UI', size=9, weight='bold'),
+            'ui_large': tkfont.Font(family='Segoe UI', size=10),
+            'heading': tkfont.Font(family='Segoe UI', size=10, weight='bold'),
+            'title': tkfont.Font(family='Segoe UI', size=16, weight='bold'),
+            'mono': tkfont.Font(family='Consolas', size=9)
+        }
+    
     def setup_styles(self):
         """Configure professional GUI styles"""
+        colors = self.colors
         style = ttk.Style()
         style.theme_use('clam')
         
         # Professional dark theme configuration
         style.configure('TNotebook', 
-                       background=self.colors['bg_primary'], 
+                       background=colors['bg_primary'], 
                        borderwidth=0,
                        tabmargins=[0, 0, 0, 0])
         
         style.configure('TNotebook.Tab', 
-                       background=self.colors['bg_secondary'], 
-                       foreground=self.colors['text_primary'],
+                       background=colors['bg_secondary'], 
+                       foreground=colors['text_primary'],
                        padding=[25, 12],
-                       font=('Segoe UI', 10, 'bold'))
+                       font=self.fonts['heading'])
         
         style.map('TNotebook.Tab', 
-                 background=[('selected', self.colors['accent_blue']),
-                           ('active', self.colors['bg_tertiary'])])
+                 background=[('selected', colors['accent_blue']),
+                           ('active', colors['bg_tertiary'])])
         
         style.configure('TFrame', 
-                       background=self.colors['bg_primary'])
+                       background=colors['bg_primary'])
         
         style.configure('TLabel', 
-                       background=self.colors['bg_primary'], 
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 9))
+                       background=colors['bg_primary'], 
+                       foreground=colors['text_primary'],
+                       font=self.fonts['ui'])
         
         style.configure('TButton', 
-                       background=self.colors['accent_blue'], 
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 9, 'bold'),
+                       background=colors['accent_blue'], 
+                       foreground=colors['text_primary'],
+                       font=self.fonts['ui_bold'],
                        padding=[15, 8])
         
         style.map('TButton', 
-                 background=[('active', self.colors['accent_green']),
-                           ('pressed', self.colors['accent_orange'])])
+                 background=[('active', colors['accent_green']),
+                           ('pressed', colors['accent_orange'])])
         
         # Special button styles
         style.configure('Scan.TButton',
-                       background=self.colors['accent_green'],
-                       font=('Segoe UI', 10, 'bold'),
+                       background=colors['accent_green'],
+                       font=self.fonts['heading'],
                        padding=[20, 10])
         
         style.map('Scan.TButton',
-                 background=[('active', self.colors['success']),
-                           ('pressed', self.colors['accent_orange'])])
+                 background=[('active', colors['success']),
+                           ('pressed', colors['accent_orange'])])
         
         style.configure('Stop.TButton',
-                       background=self.colors['accent_red'],
-                       font=('Segoe UI', 9, 'bold'))
+                       background=colors['accent_red'],
+                       font=self.fonts['ui_bold'])
         
         style.map('Stop.TButton',
-                 background=[('active', self.colors['error']),
-                           ('pressed', self.colors['accent_orange'])])
+                 background=[('active', colors['error']),
+                           ('pressed', colors['accent_orange'])])
         
         # Entry styles
         style.configure('TEntry',
-                       fieldbackground=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       bordercolor=self.colors['border'],
-                       font=('Consolas', 9))
+                       fieldbackground=colors['bg_secondary'],
+                       foreground=colors['text_primary'],
+                       bordercolor=colors['border'],
+                       font=self.fonts['mono'])
         
         # Combobox styles
         style.configure('TCombobox',
-                       fieldbackground=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       background=self.colors['bg_secondary'])
+                       fieldbackground=colors['bg_secondary'],
+                       foreground=colors['text_primary'],
+                       background=colors['bg_secondary'])
+    
+    def create_variables(self):
+        """Create the Tk variables backing every SQLMap option"""
+        # Basic options
+        self.url_var = tk.StringVar()
+        self.data_var = tk.StringVar()
+        self.cookie_var = tk.StringVar()
+        self.user_agent_var = tk.StringVar()
+        self.referer_var = tk.StringVar()
+        self.headers_var = tk.StringVar()
+        self.proxy_var = tk.StringVar()
+        self.tor_var = tk.BooleanVar()
+        self.random_agent_var = tk.BooleanVar()
+        
+        # Advanced options
+        self.risk_var = tk.StringVar(value="1")
+        self.level_var = tk.StringVar(value="1")
+        self.threads_var = tk.StringVar(value="1")
+        self.timeout_var = tk.StringVar(value="30")
+        self.retries_var = tk.StringVar(value="3")
+        self.delay_var = tk.StringVar(value="0")
+        self.batch_var = tk.BooleanVar()
+        self.verbose_var = tk.BooleanVar()
+        self.output_dir_var = tk.StringVar()
+        
+        # Enumeration options
+        self.enum_dbs_var = tk.BooleanVar()
+        self.enum_tables_var = tk.BooleanVar()
+        self.enum_columns_var = tk.BooleanVar()
+        self.enum_schema_var = tk.BooleanVar()
+        self.database_var = tk.StringVar()
+        self.table_var = tk.StringVar()
+        self.dump_all_var = tk.BooleanVar()
+        self.dump_table_var = tk.BooleanVar()
+        self.dump_columns_var = tk.BooleanVar()
+        self.count_var = tk.BooleanVar()
+        
+        # Bruteforce options
+        self.common_tables_var = tk.BooleanVar()
+        self.common_columns_var = tk.BooleanVar()
+        self.wordlist_var = tk.StringVar()
+        
+        # Technique options
+        self.tech_boolean_var = tk.BooleanVar()
+        self.tech_error_var = tk.BooleanVar()
+        self.tech_union_var = tk.BooleanVar()
+        self.tech_stacked_var = tk.BooleanVar()
+        self.tech_time_var = tk.BooleanVar()
+        self.tech_inline_var = tk.BooleanVar()
+        self.os_detect_var = tk.BooleanVar()
+        self.dbms_detect_var = tk.BooleanVar()
     
     def create_interface(self):
         """Create the main GUI interface"""
+        colors = self.colors
         # Header frame with title and main scan button
         header_frame = ttk.Frame(self.root)
         header_frame.pack(fill=tk.X, padx=15, pady=(15, 10))
@@ -134,16 +401,16 @@ class SQLMapGUI:
         
         title_label = tk.Label(title_frame, 
                               text="🔒 SQLMap Professional Scanner", 
-                              font=('Segoe UI', 16, 'bold'),
-                              bg=self.colors['bg_primary'],
-                              fg=self.colors['accent_blue'])
+                              font=self.fonts['title'],
+                              bg=colors['bg_primary'],
+                              fg=colors['accent_blue'])
         title_label.pack(anchor=tk.W)
         
         subtitle_label = tk.Label(title_frame,
                                  text="Advanced SQL Injection Testing & Database Security Assessment",
-                                 font=('Segoe UI', 10),
-                                 bg=self.colors['bg_primary'],
-                                 fg=self.colors['text_secondary'])
+                                 font=self.fonts['ui_large'],
+                                 bg=colors['bg_primary'],
+                                 fg=colors['text_secondary'])
         subtitle_label.pack(anchor=tk.W)
         
         # Main scan button in header
@@ -161,152 +428,130 @@ class SQLMapGUI:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Create tabs
-        self.create_basic_tab()
-        self.create_advanced_tab()
-        self.create_enumeration_tab()
-        self.create_bruteforce_tab()
-        self.create_techniques_tab()
-        self.create_output_tab()
-        self.create_presets_tab()
+        # Create tabs; only the basic and output tabs are built up front,
+        # the others are built the first time they are selected
+        self._tab_builders = {}
+        tabs = [
+            ("🎯 Basic Options", self.create_basic_tab, True),
+            ("⚡ Advanced Options", self.create_advanced_tab, False),
+            ("🔍 Enumeration", self.create_enumeration_tab, False),
+            ("💥 Bruteforce", self.create_bruteforce_tab, False),
+            ("🎯 Techniques", self.create_techniques_tab, False),
+            ("📊 Output & Results", self.create_output_tab, True),
+            ("⚙️ Presets", self.create_presets_tab, False)
+        ]
+        for text, builder, eager in tabs:
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=text)
+            if eager:
+                builder(tab_frame)
+            else:
+                self._tab_builders[str(tab_frame)] = (tab_frame, builder)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Status bar
         self.create_status_bar()
     
-    def create_basic_tab(self):
+    def _on_tab_changed(self, event):
+        """Build a deferred tab the first time it is selected"""
+        pending = self._tab_builders.pop(self.notebook.select(), None)
+        if pending:
+            tab_frame, builder = pending
+            builder(tab_frame)
+    
+    def create_basic_tab(self, basic_frame):
         """Create basic SQLMap options tab"""
-        basic_frame = ttk.Frame(self.notebook)
-        self.notebook.add(basic_frame, text="🎯 Basic Options")
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(basic_frame, bg=self.colors['bg_primary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(basic_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
         # Target URL
-        ttk.Label(scrollable_frame, text="🎯 Target URL:", font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, padx=10, pady=(15, 5))
-        self.url_var = tk.StringVar()
-        url_entry = ttk.Entry(scrollable_frame, textvariable=self.url_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="🎯 Target URL:", font=self.fonts['heading']).grid(row=0, column=0, sticky=tk.W, padx=10, pady=(15, 5))
+        url_entry = ttk.Entry(basic_frame, textvariable=self.url_var, width=70, font=self.fonts['mono'])
         url_entry.grid(row=0, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(15, 5))
         
         # Request data
-        ttk.Label(scrollable_frame, text="📤 POST Data:", font=('Segoe UI', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.data_var = tk.StringVar()
-        data_entry = ttk.Entry(scrollable_frame, textvariable=self.data_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="📤 POST Data:", font=self.fonts['heading']).grid(row=1, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        data_entry = ttk.Entry(basic_frame, textvariable=self.data_var, width=70, font=self.fonts['mono'])
         data_entry.grid(row=1, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # Cookie
-        ttk.Label(scrollable_frame, text="🍪 Cookie:", font=('Segoe UI', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.cookie_var = tk.StringVar()
-        cookie_entry = ttk.Entry(scrollable_frame, textvariable=self.cookie_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="🍪 Cookie:", font=self.fonts['heading']).grid(row=2, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        cookie_entry = ttk.Entry(basic_frame, textvariable=self.cookie_var, width=70, font=self.fonts['mono'])
         cookie_entry.grid(row=2, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # User-Agent
-        ttk.Label(scrollable_frame, text="🌐 User-Agent:", font=('Segoe UI', 10, 'bold')).grid(row=3, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.user_agent_var = tk.StringVar()
-        user_agent_entry = ttk.Entry(scrollable_frame, textvariable=self.user_agent_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="🌐 User-Agent:", font=self.fonts['heading']).grid(row=3, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        user_agent_entry = ttk.Entry(basic_frame, textvariable=self.user_agent_var, width=70, font=self.fonts['mono'])
         user_agent_entry.grid(row=3, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # Referer
-        ttk.Label(scrollable_frame, text="🔗 Referer:", font=('Segoe UI', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.referer_var = tk.StringVar()
-        referer_entry = ttk.Entry(scrollable_frame, textvariable=self.referer_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="🔗 Referer:", font=self.fonts['heading']).grid(row=4, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        referer_entry = ttk.Entry(basic_frame, textvariable=self.referer_var, width=70, font=self.fonts['mono'])
         referer_entry.grid(row=4, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # Headers
-        ttk.Label(scrollable_frame, text="📋 Custom Headers:", font=('Segoe UI', 10, 'bold')).grid(row=5, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.headers_var = tk.StringVar()
-        headers_entry = ttk.Entry(scrollable_frame, textvariable=self.headers_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="📋 Custom Headers:", font=self.fonts['heading']).grid(row=5, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        headers_entry = ttk.Entry(basic_frame, textvariable=self.headers_var, width=70, font=self.fonts['mono'])
         headers_entry.grid(row=5, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # Proxy
-        ttk.Label(scrollable_frame, text="🔒 Proxy:", font=('Segoe UI', 10, 'bold')).grid(row=6, column=0, sticky=tk.W, padx=10, pady=(10, 5))
-        self.proxy_var = tk.StringVar()
-        proxy_entry = ttk.Entry(scrollable_frame, textvariable=self.proxy_var, width=70, font=('Consolas', 9))
+        ttk.Label(basic_frame, text="🔒 Proxy:", font=self.fonts['heading']).grid(row=6, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+        proxy_entry = ttk.Entry(basic_frame, textvariable=self.proxy_var, width=70, font=self.fonts['mono'])
         proxy_entry.grid(row=6, column=1, columnspan=2, sticky=tk.EW, padx=10, pady=(10, 5))
         
         # Options frame
-        options_frame = ttk.LabelFrame(scrollable_frame, text="⚙️ Advanced Options", padding=15)
+        options_frame = ttk.LabelFrame(basic_frame, text="⚙️ Advanced Options", padding=15)
         options_frame.grid(row=7, column=0, columnspan=3, sticky=tk.EW, padx=10, pady=(20, 10))
         
         # Tor
-        self.tor_var = tk.BooleanVar()
         tor_check = ttk.Checkbutton(options_frame, text="🌐 Use Tor Network", variable=self.tor_var)
         tor_check.grid(row=0, column=0, sticky=tk.W, padx=10, pady=5)
         
         # Random Agent
-        self.random_agent_var = tk.BooleanVar()
         random_agent_check = ttk.Checkbutton(options_frame, text="🎲 Random User-Agent", variable=self.random_agent_var)
         random_agent_check.grid(row=0, column=1, sticky=tk.W, padx=10, pady=5)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
         # Configure grid weights
-        scrollable_frame.columnconfigure(1, weight=1)
-        basic_frame.columnconfigure(0, weight=1)
+        basic_frame.columnconfigure(1, weight=1)
     
-    def create_advanced_tab(self):
+    def create_advanced_tab(self, advanced_frame):
         """Create advanced SQLMap options tab"""
-        advanced_frame = ttk.Frame(self.notebook)
-        self.notebook.add(advanced_frame, text="⚡ Advanced Options")
-        
         # Risk level
         ttk.Label(advanced_frame, text="Risk Level:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.risk_var = tk.StringVar(value="1")
         risk_combo = ttk.Combobox(advanced_frame, textvariable=self.risk_var, values=["1", "2", "3"], width=10)
         risk_combo.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Level
         ttk.Label(advanced_frame, text="Level:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        self.level_var = tk.StringVar(value="1")
         level_combo = ttk.Combobox(advanced_frame, textvariable=self.level_var, values=["1", "2", "3", "4", "5"], width=10)
         level_combo.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Threads
         ttk.Label(advanced_frame, text="Threads:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.threads_var = tk.StringVar(value="1")
         threads_entry = ttk.Entry(advanced_frame, textvariable=self.threads_var, width=10)
         threads_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Timeout
         ttk.Label(advanced_frame, text="Timeout:").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
-        self.timeout_var = tk.StringVar(value="30")
         timeout_entry = ttk.Entry(advanced_frame, textvariable=self.timeout_var, width=10)
         timeout_entry.grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Retries
         ttk.Label(advanced_frame, text="Retries:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.retries_var = tk.StringVar(value="3")
         retries_entry = ttk.Entry(advanced_frame, textvariable=self.retries_var, width=10)
         retries_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Delay
         ttk.Label(advanced_frame, text="Delay:").grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
-        self.delay_var = tk.StringVar(value="0")
         delay_entry = ttk.Entry(advanced_frame, textvariable=self.delay_var, width=10)
         delay_entry.grid(row=2, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Batch mode
-        self.batch_var = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="Batch Mode (No questions)", variable=self.batch_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
         # Verbose
-        self.verbose_var = tk.BooleanVar()
         ttk.Checkbutton(advanced_frame, text="Verbose Output", variable=self.verbose_var).grid(row=3, column=2, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
         # Output directory
         ttk.Label(advanced_frame, text="Output Directory:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        self.output_dir_var = tk.StringVar()
         output_entry = ttk.Entry(advanced_frame, textvariable=self.output_dir_var, width=40)
         output_entry.grid(row=4, column=1, columnspan=2, sticky=tk.EW, padx=5, pady=5)
         ttk.Button(advanced_frame, text="Browse", command=self.browse_output_dir).grid(row=4, column=3, padx=5, pady=5)
@@ -314,69 +559,50 @@ class SQLMapGUI:
         # Configure grid weights
         advanced_frame.columnconfigure(1, weight=1)
     
-    def create_enumeration_tab(self):
+    def create_enumeration_tab(self, enum_frame):
         """Create enumeration options tab"""
-        enum_frame = ttk.Frame(self.notebook)
-        self.notebook.add(enum_frame, text="🔍 Enumeration")
-        
         # Database enumeration
         ttk.Label(enum_frame, text="Database Enumeration:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.enum_dbs_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Enumerate Databases", variable=self.enum_dbs_var).grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.enum_tables_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Enumerate Tables", variable=self.enum_tables_var).grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.enum_columns_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Enumerate Columns", variable=self.enum_columns_var).grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.enum_schema_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Enumerate Schema", variable=self.enum_schema_var).grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
         
         # Specific database/table
         ttk.Label(enum_frame, text="Specific Database:").grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
-        self.database_var = tk.StringVar()
         database_entry = ttk.Entry(enum_frame, textvariable=self.database_var, width=30)
         database_entry.grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(enum_frame, text="Specific Table:").grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
-        self.table_var = tk.StringVar()
         table_entry = ttk.Entry(enum_frame, textvariable=self.table_var, width=30)
         table_entry.grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
         
         # Dump options
         ttk.Label(enum_frame, text="Dump Options:").grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.dump_all_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Dump All", variable=self.dump_all_var).grid(row=8, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.dump_table_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Dump Table", variable=self.dump_table_var).grid(row=9, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.dump_columns_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Dump Columns", variable=self.dump_columns_var).grid(row=10, column=0, sticky=tk.W, padx=5, pady=2)
         
         # Count
-        self.count_var = tk.BooleanVar()
         ttk.Checkbutton(enum_frame, text="Count Entries", variable=self.count_var).grid(row=11, column=0, sticky=tk.W, padx=5, pady=2)
     
-    def create_bruteforce_tab(self):
+    def create_bruteforce_tab(self, brute_frame):
         """Create bruteforce options tab"""
-        brute_frame = ttk.Frame(self.notebook)
-        self.notebook.add(brute_frame, text="💥 Bruteforce")
-        
         # Common table names
-        self.common_tables_var = tk.BooleanVar()
         ttk.Checkbutton(brute_frame, text="Common Table Names", variable=self.common_tables_var).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
         # Common column names
-        self.common_columns_var = tk.BooleanVar()
         ttk.Checkbutton(brute_frame, text="Common Column Names", variable=self.common_columns_var).grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         
         # Custom wordlist
         ttk.Label(brute_frame, text="Custom Wordlist:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.wordlist_var = tk.StringVar()
         wordlist_entry = ttk.Entry(brute_frame, textvariable=self.wordlist_var, width=50)
         wordlist_entry.grid(row=2, column=1, sticky=tk.EW, padx=5, pady=5)
         ttk.Button(brute_frame, text="Browse", command=self.browse_wordlist).grid(row=2, column=2, padx=5, pady=5)
@@ -384,63 +610,51 @@ class SQLMapGUI:
         # Configure grid weights
         brute_frame.columnconfigure(1, weight=1)
     
-    def create_techniques_tab(self):
+    def create_techniques_tab(self, tech_frame):
         """Create SQL injection techniques tab"""
-        tech_frame = ttk.Frame(self.notebook)
-        self.notebook.add(tech_frame, text="🎯 Techniques")
-        
         # Injection techniques
         ttk.Label(tech_frame, text="Injection Techniques:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.tech_boolean_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="Boolean-based blind", variable=self.tech_boolean_var).grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.tech_error_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="Error-based", variable=self.tech_error_var).grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.tech_union_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="UNION query-based", variable=self.tech_union_var).grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.tech_stacked_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="Stacked queries", variable=self.tech_stacked_var).grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.tech_time_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="Time-based blind", variable=self.tech_time_var).grid(row=5, column=0, sticky=tk.W, padx=5, pady=2)
         
-        self.tech_inline_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="Inline queries", variable=self.tech_inline_var).grid(row=6, column=0, sticky=tk.W, padx=5, pady=2)
         
         # OS detection
-        self.os_detect_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="OS Detection", variable=self.os_detect_var).grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
         
         # DBMS detection
-        self.dbms_detect_var = tk.BooleanVar()
         ttk.Checkbutton(tech_frame, text="DBMS Detection", variable=self.dbms_detect_var).grid(row=8, column=0, sticky=tk.W, padx=5, pady=2)
     
-    def create_output_tab(self):
+    def create_output_tab(self, output_frame):
         """Create output display tab"""
-        output_frame = ttk.Frame(self.notebook)
-        self.notebook.add(output_frame, text="📊 Output & Results")
-        
+        colors = self.colors
         # Command display
         ttk.Label(output_frame, text="Generated Command:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.command_text = scrolledtext.ScrolledText(output_frame, height=8, width=80, 
-                                                     bg=self.colors['bg_secondary'], 
-                                                     fg=self.colors['text_primary'], 
-                                                     insertbackground=self.colors['accent_blue'],
-                                                     font=('Consolas', 9))
+                                                     bg=colors['bg_secondary'], 
+                                                     fg=colors['text_primary'], 
+                                                     insertbackground=colors['accent_blue'],
+                                                     font=self.fonts['mono'],
+                                                     state='disabled')
         self.command_text.grid(row=1, column=0, columnspan=3, sticky=tk.EW, padx=5, pady=5)
         
         # Output display
-        ttk.Label(output_frame, text="📊 SQLMap Output:", font=('Segoe UI', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(output_frame, text="📊 SQLMap Output:", font=self.fonts['heading']).grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.output_text = scrolledtext.ScrolledText(output_frame, height=20, width=80, 
-                                                    bg=self.colors['bg_secondary'], 
-                                                    fg=self.colors['text_primary'], 
-                                                    insertbackground=self.colors['accent_blue'],
-                                                    font=('Consolas', 9))
+                                                    bg=colors['bg_secondary'], 
+                                                    fg=colors['text_primary'], 
+                                                    insertbackground=colors['accent_blue'],
+                                                    font=self.fonts['mono'])
         self.output_text.grid(row=3, column=0, columnspan=3, sticky=tk.EW, padx=5, pady=5)
         
         # Control buttons
@@ -456,19 +670,17 @@ class SQLMapGUI:
         # Configure grid weights
         output_frame.columnconfigure(0, weight=1)
     
-    def create_presets_tab(self):
+    def create_presets_tab(self, preset_frame):
         """Create presets tab"""
-        preset_frame = ttk.Frame(self.notebook)
-        self.notebook.add(preset_frame, text="⚙️ Presets")
-        
+        colors = self.colors
         # Preset list
-        ttk.Label(preset_frame, text="⚙️ Available Presets:", font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(preset_frame, text="⚙️ Available Presets:", font=self.fonts['heading']).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         
         self.preset_listbox = tk.Listbox(preset_frame, height=15, 
-                                        bg=self.colors['bg_secondary'], 
-                                        fg=self.colors['text_primary'], 
-                                        selectbackground=self.colors['accent_blue'],
-                                        font=('Segoe UI', 9),
+                                        bg=colors['bg_secondary'], 
+                                        fg=colors['text_primary'], 
+                                        selectbackground=colors['accent_blue'],
+                                        font=self.fonts['ui'],
                                         relief=tk.FLAT,
                                         borderwidth=0)
         self.preset_listbox.grid(row=1, column=0, columnspan=2, sticky=tk.EW, padx=5, pady=5)
@@ -483,32 +695,35 @@ class SQLMapGUI:
         
         # Configure grid weights
         preset_frame.columnconfigure(0, weight=1)
+        
+        self._refresh_preset_list()
     
     def create_status_bar(self):
         """Create professional status bar"""
+        colors = self.colors
         status_frame = ttk.Frame(self.root)
         status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=(0, 10))
         
         # Status label
         self.status_var = tk.StringVar(value="🟢 Ready - Enter target URL to begin scanning")
-        status_label = tk.Label(status_frame, 
-                               textvariable=self.status_var, 
-                               bg=self.colors['bg_secondary'],
-                               fg=self.colors['text_primary'],
-                               font=('Segoe UI', 9),
-                               relief=tk.FLAT,
-                               anchor=tk.W,
-                               padx=10,
-                               pady=5)
-        status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.status_label = tk.Label(status_frame, 
+                                    textvariable=self.status_var, 
+                                    bg=colors['bg_secondary'],
+                                    fg=colors['text_primary'],
+                                    font=self.fonts['ui'],
+                                    relief=tk.FLAT,
+                                    anchor=tk.W,
+                                    padx=10,
+                                    pady=5)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Progress indicator
         self.progress_var = tk.StringVar(value="")
         progress_label = tk.Label(status_frame,
                                  textvariable=self.progress_var,
-                                 bg=self.colors['bg_secondary'],
-                                 fg=self.colors['accent_blue'],
-                                 font=('Segoe UI', 9, 'bold'),
+                                 bg=colors['bg_secondary'],
+                                 fg=colors['accent_blue'],
+                                 font=self.fonts['ui_bold'],
                                  padx=10,
                                  pady=5)
         progress_label.pack(side=tk.RIGHT)
@@ -516,7 +731,11 @@ class SQLMapGUI:
     def quick_scan(self):
         """Quick scan with basic settings"""
         if not self.url_var.get():
-            messagebox.showerror("Error", "Please enter a target URL first")
+            self._flash_status("🔴 Please enter a target URL first")
+            return
+        
+        if self.is_running:
+            self._flash_status("🟠 SQLMap is already running")
             return
         
         # Set basic scan parameters
@@ -534,6 +753,21 @@ class SQLMapGUI:
         self.status_var.set("🟡 Quick scan initiated...")
         self.progress_var.set("⏳ Scanning...")
     
+    def _flash_status(self, message, duration=4000):
+        """Show a transient error in the status bar without blocking the event loop"""
+        if self._status_reset_id:
+            self.root.after_cancel(self._status_reset_id)
+        self.status_var.set(message)
+        self.status_label.configure(fg=self.colors['error'])
+        self._status_reset_id = self.root.after(duration, self._reset_status, message)
+    
+    def _reset_status(self, message):
+        """Restore the status bar after a transient error"""
+        self._status_reset_id = None
+        self.status_label.configure(fg=self.colors['text_primary'])
+        if self.status_var.get() == message:
+            self.status_var.set("🟡 Executing SQLMap..." if self.is_running else "🟢 Ready")
+    
     def browse_output_dir(self):
         """Browse for output directory"""
         directory = filedialog.askdirectory()
@@ -549,240 +783,304 @@ class SQLMapGUI:
         if filename:
             self.wordlist_var.set(filename)
     
-    def generate_command(self):
-        """Generate SQLMap command based on current settings"""
+    def bind_option_traces(self):
+        """Mirror option values into a plain dict and refresh the preview on change"""
+        option_names = [option[0] for option in self._VALUE_FLAGS + self._NUMERIC_FLAGS + self._BOOL_FLAGS + self._TECH_MAP]
+        
+        # Values are read from Tcl only when they change, keyed by attribute name
+        self._option_names = {}
+        self._option_values = {}
+        for name in option_names:
+            var = getattr(self, name)
+            self._option_names[str(var)] = name
+            self._option_values[name] = var.get()
+            var.trace_add('write', self._on_option_changed)
+    
+    def _on_option_changed(self, tcl_name, index, mode):
+        """Record the new option value and schedule a preview refresh"""
+        name = self._option_names[tcl_name]
+        self._option_values[name] = getattr(self, name).get()
+        self._schedule_regen()
+    
+    def _schedule_regen(self):
+        """Debounce command regeneration to the last change in a 150 ms window"""
+        if self._regen_id:
+            self.root.after_cancel(self._regen_id)
+        self._regen_id = self.root.after(150, self._regenerate_preview)
+    
+    def _regenerate_preview(self):
+        """Regenerate the command preview unless a scan is running"""
+        self._regen_id = None
+        if self.is_running:
+            # Regenerate once the scan ends so the next Execute uses the new options
+            self._regen_pending = True
+        else:
+            self._refresh_command()
+    
+    def _apply_pending_regen(self):
+        """Schedule the preview refresh skipped while the scan was running"""
+        if self._regen_pending:
+            self._regen_pending = False
+            self._schedule_regen()
+    
+    def _build_argv(self, values):
+        """Build the SQLMap argv tuple from the option values"""
         command_parts = ["sqlmap"]
         
-        # Basic options
-        if self.url_var.get():
-            command_parts.append(f"-u \"{self.url_var.get()}\"")
-        
-        if self.data_var.get():
-            command_parts.append(f"--data=\"{self.data_var.get()}\"")
-        
-        if self.cookie_var.get():
-            command_parts.append(f"--cookie=\"{self.cookie_var.get()}\"")
+        # Value options
+        for name, flag in self._VALUE_FLAGS:
+            value = values[name]
+            if value:
+                command_parts.extend((flag, value))
         
-        if self.user_agent_var.get():
-            command_parts.append(f"--user-agent=\"{self.user_agent_var.get()}\"")
-        
-        if self.referer_var.get():
-            command_parts.append(f"--referer=\"{self.referer_var.get()}\"")
-        
-        if self.headers_var.get():
-            command_parts.append(f"--headers=\"{self.headers_var.get()}\"")
-        
-        if self.proxy_var.get():
-            command_parts.append(f"--proxy=\"{self.proxy_var.get()}\"")
-        
-        # Advanced options
-        if self.risk_var.get() != "1":
-            command_parts.append(f"--risk={self.risk_var.get()}")
-        
-        if self.level_var.get() != "1":
-            command_parts.append(f"--level={self.level_var.get()}")
-        
-        if self.threads_var.get() != "1":
-            command_parts.append(f"--threads={self.threads_var.get()}")
-        
-        if self.timeout_var.get() != "30":
-            command_parts.append(f"--timeout={self.timeout_var.get()}")
-        
-        if self.retries_var.get() != "3":
-            command_parts.append(f"--retries={self.retries_var.get()}")
-        
-        if self.delay_var.get() != "0":
-            command_parts.append(f"--delay={self.delay_var.get()}")
+        # Numeric options
+        command_parts.extend(f"{flag}{value}" for name, flag, default in self._NUMERIC_FLAGS if (value := values[name]) != default)
         
         # Boolean options
-        if self.tor_var.get():
-            command_parts.append("--tor")
-        
-        if self.random_agent_var.get():
-            command_parts.append("--random-agent")
-        
-        if self.batch_var.get():
-            command_parts.append("--batch")
-        
-        if self.verbose_var.get():
-            command_parts.append("-v")
-        
-        # Enumeration options
-        if self.enum_dbs_var.get():
-            command_parts.append("--dbs")
-        
-        if self.enum_tables_var.get():
-            command_parts.append("--tables")
-        
-        if self.enum_columns_var.get():
-            command_parts.append("--columns")
-        
-        if self.enum_schema_var.get():
-            command_parts.append("--schema")
-        
-        if self.database_var.get():
-            command_parts.append(f"-D \"{self.database_var.get()}\"")
-        
-        if self.table_var.get():
-            command_parts.append(f"-T \"{self.table_var.get()}\"")
-        
-        if self.dump_all_var.get():
-            command_parts.append("--dump-all")
-        
-        if self.dump_table_var.get():
-            command_parts.append("--dump")
-        
-        if self.dump_columns_var.get():
-            command_parts.append("--dump-columns")
-        
-        if self.count_var.get():
-            command_parts.append("--count")
-        
-        # Bruteforce options
-        if self.common_tables_var.get():
-            command_parts.append("--common-tables")
-        
-        if self.common_columns_var.get():
-            command_parts.append("--common-columns")
-        
-        if self.wordlist_var.get():
-            command_parts.append(f"--wordlist=\"{self.wordlist_var.get()}\"")
+        command_parts.extend(flag for name, flag in self._BOOL_FLAGS if values[name])
         
         # Technique options
-        techniques = []
-        if self.tech_boolean_var.get():
-            techniques.append("B")
-        if self.tech_error_var.get():
-            techniques.append("E")
-        if self.tech_union_var.get():
-            techniques.append("U")
-        if self.tech_stacked_var.get():
-            techniques.append("S")
-        if self.tech_time_var.get():
-            techniques.append("T")
-        if self.tech_inline_var.get():
-            techniques.append("Q")
-        
-        if techniques:
-            command_parts.append(f"--technique={''.join(techniques)}")
-        
-        if self.os_detect_var.get():
-            command_parts.append("--os-detect")
-        
-        if self.dbms_detect_var.get():
-            command_parts.append("--dbms-detect")
+        letters = "".join(letter for name, letter in self._TECH_MAP if values[name])
+        if letters:
+            command_parts.append(f"--technique={letters}")
         
-        # Output directory
-        if self.output_dir_var.get():
-            command_parts.append(f"--output-dir=\"{self.output_dir_var.get()}\"")
-        
-        self.current_command = " ".join(command_parts)
-        self.command_text.delete(1.0, tk.END)
-        self.command_text.insert(1.0, self.current_command)
+        return tuple(command_parts)
+    
+    def _refresh_command(self):
+        """Rebuild the argv and command preview from the current settings"""
+        values = self._option_values
+        
+        # Reuse the argv built earlier for identical settings
+        key = tuple(values.values())
+        argv = self._command_cache.get(key)
+        if argv is None:
+            argv = self._build_argv(values)
+            if len(self._command_cache) >= COMMAND_CACHE_SIZE:
+                self._command_cache.clear()
+            self._command_cache[key] = argv
+        
+        # Only rewrite the preview when the command actually changed
+        if argv != self._command_signature:
+            self._command_signature = argv
+            self.current_argv = argv
+            self.current_command = shlex.join(argv)
+            # The preview is read-only so it always shows the argv that Execute runs
+            self.command_text.configure(state='normal')
+            self.command_text.delete(1.0, tk.END)
+            self.command_text.insert(1.0, self.current_command)
+            self.command_text.configure(state='disabled')
+    
+    def generate_command(self):
+        """Generate SQLMap command based on current settings"""
+        self._refresh_command()
         self.status_var.set("✅ Command generated successfully")
         self.progress_var.set("🔧 Ready to execute")
     
     def execute_sqlmap(self):
         """Execute SQLMap command with professional feedback"""
-        if not self.current_command:
-            messagebox.showerror("Error", "Please generate a command first")
+        if not self.current_argv:
+            self._flash_status("🔴 Please generate a command first")
             return
         
         if self.is_running:
-            messagebox.showwarning("Warning", "SQLMap is already running")
+            self._flash_status("🟠 SQLMap is already running")
             return
         
         self.is_running = True
+        self._stop_requested = False
         self.status_var.set("🟡 Executing SQLMap...")
         self.progress_var.set("⏳ Initializing...")
         
         # Clear previous output
         self.output_text.delete(1.0, tk.END)
+        self._display_chunks.clear()
+        self._display_dropped_shown = self._display_dropped
+        with self._output_lock:
+            self._output_log = io.StringIO()
         
         # Add header to output
-        self.output_text.insert(tk.END, "="*80 + "\n")
-        self.output_text.insert(tk.END, "🔒 SQLMap Professional Scanner - Execution Started\n")
-        self.output_text.insert(tk.END, f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self.output_text.insert(tk.END, f"🎯 Command: {self.current_command}\n")
-        self.output_text.insert(tk.END, "="*80 + "\n\n")
-        
-        # Execute in separate thread
-        thread = threading.Thread(target=self._run_sqlmap)
-        thread.daemon = True
-        thread.start()
-    
-    def _run_sqlmap(self):
-        """Run SQLMap command in separate thread"""
+        self._append_output("".join([
+            self._SEP,
+            "🔒 SQLMap Professional Scanner - Execution Started\n",
+            f"⏰ Time: {datetime.now():%Y-%m-%d %H:%M:%S}\n",
+            f"🎯 Command: {self.current_command}\n",
+            self._SEP,
+            "\n"
+        ]))
+        
+        # Execute on the background event loop
+        asyncio.run_coroutine_threadsafe(self._run_sqlmap(self.current_argv), self.loop)
+        if self._pump_id:
+            self.root.after_cancel(self._pump_id)
+        self._pump_id = self.root.after(OUTPUT_POLL_INTERVAL, self._pump_output)
+    
+    async def _run_sqlmap(self, argv):
+        """Run SQLMap command as an asyncio subprocess"""
         try:
             # Execute the command
-            process = subprocess.Popen(
-                self.current_command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+            self._process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=READ_CHUNK_SIZE
             )
             
-            # Read output in real-time
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    self.root.after(0, self._update_output, line)
+            # A Stop clicked while the process was starting found no
+            # process to terminate; honour it now
+            if self._stop_requested:
+                self.loop.create_task(self._terminate_process())
+            
+            # Read output in real-time, in chunks so progress lines ending
+            # in a carriage return are not held back until the next newline.
+            # The incremental decoder keeps multi-byte characters split
+            # across chunk boundaries intact.
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            while True:
+                chunk = await self._process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._record_output(decoder.decode(chunk))
+            
+            # Flush any trailing partial character
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                self._record_output(tail)
             
-            process.wait()
+            # EOF on stdout means the process is exiting; collect its status
+            returncode = await self._process.wait()
             
-            self.root.after(0, self._execution_finished)
+            self.root.after(0, self._execution_finished, returncode)
             
         except Exception as e:
             self.root.after(0, self._execution_error, str(e))
+        finally:
+            self._process = None
     
-    def _update_output(self, line):
-        """Update output display"""
-        self.output_text.insert(tk.END, line)
-        self.output_text.see(tk.END)
-        self.root.update_idletasks()
+    def _record_output(self, text):
+        """Log output on the loop thread and queue it for display"""
+        with self._output_lock:
+            self._output_log.write(text)
+        if len(self._display_chunks) == MAX_DISPLAY_BACKLOG:
+            self._display_dropped += 1
+        self._display_chunks.append(text)
     
-    def _execution_finished(self):
+    def _pump_output(self):
+        """Periodically move queued output into the display"""
+        self._pump_id = None
+        self._flush_output(MAX_CHARS_PER_FLUSH)
+        if self.is_running:
+            self._pump_id = self.root.after(OUTPUT_POLL_INTERVAL, self._pump_output)
+    
+    def _flush_output(self, limit=None):
+        """Insert queued output, about limit characters, in a single widget update"""
+        chunks = []
+        size = 0
+        try:
+            while limit is None or size < limit:
+                chunk = self._display_chunks.popleft()
+                chunks.append(chunk)
+                size += len(chunk)
+        except IndexError:
+            pass
+        
+        # Chunks dropped since the last update preceded the ones just taken
+        dropped = self._display_dropped
+        if dropped != self._display_dropped_shown:
+            self._display_dropped_shown = dropped
+            chunks.insert(0, "\n[… output omitted from display, use Save Output for the full log …]\n")
+        
+        if chunks:
+            self._display_output("".join(chunks))
+    
+    def _append_output(self, text):
+        """Append text to the full output log and to the display"""
+        with self._output_lock:
+            self._output_log.write(text)
+        self._display_output(text)
+    
+    def _display_output(self, text):
+        """Insert text into the display, keeping it capped and scrolled"""
+        self.output_text.insert(tk.END, text)
+        self._trim_output()
+        self.output_text.yview_moveto(1.0)
+    
+    def _trim_output(self):
+        """Drop the oldest lines once the output exceeds MAX_OUTPUT_LINES"""
+        lines = int(self.output_text.index('end-1c').split('.')[0])
+        if lines > MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'{lines - MAX_OUTPUT_LINES + 1}.0')
+    
+    def _execution_finished(self, returncode):
         """Handle execution completion"""
+        self._flush_output()
         self.is_running = False
-        self.status_var.set("🟢 SQLMap execution completed successfully")
-        self.progress_var.set("✅ Done")
+        self._apply_pending_regen()
+        if returncode == 0:
+            summary = "✅ SQLMap execution completed successfully"
+            self.status_var.set("🟢 SQLMap execution completed successfully")
+            self.progress_var.set("✅ Done")
+        else:
+            summary = f"⚠️ SQLMap exited with code {returncode}"
+            self.status_var.set(f"🟠 SQLMap exited with code {returncode}")
+            self.progress_var.set("⚠️ Finished")
         
         # Add completion footer
-        self.output_text.insert(tk.END, "\n" + "="*80 + "\n")
-        self.output_text.insert(tk.END, "✅ SQLMap execution completed successfully\n")
-        self.output_text.insert(tk.END, f"⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self.output_text.insert(tk.END, "="*80 + "\n")
-        
-        messagebox.showinfo("Success", "🎉 SQLMap execution completed successfully!")
+        self._append_output("".join([
+            "\n",
+            self._SEP,
+            f"{summary}\n",
+            f"⏰ Completed at: {datetime.now():%Y-%m-%d %H:%M:%S}\n",
+            self._SEP
+        ]))
     
     def _execution_error(self, error):
         """Handle execution error"""
+        self._flush_output()
         self.is_running = False
-        self.status_var.set("🔴 SQLMap execution failed")
+        self._apply_pending_regen()
+        self._flash_status(f"🔴 SQLMap execution failed: {error}")
         self.progress_var.set("❌ Error")
         
         # Add error footer
-        self.output_text.insert(tk.END, "\n" + "="*80 + "\n")
-        self.output_text.insert(tk.END, "❌ SQLMap execution failed\n")
-        self.output_text.insert(tk.END, f"🚨 Error: {error}\n")
-        self.output_text.insert(tk.END, f"⏰ Failed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self.output_text.insert(tk.END, "="*80 + "\n")
-        
-        messagebox.showerror("Error", f"❌ SQLMap execution failed:\n{error}")
+        self._append_output("".join([
+            "\n",
+            self._SEP,
+            "❌ SQLMap execution failed\n",
+            f"🚨 Error: {error}\n",
+            f"⏰ Failed at: {datetime.now():%Y-%m-%d %H:%M:%S}\n",
+            self._SEP
+        ]))
     
     def stop_execution(self):
         """Stop SQLMap execution"""
         if self.is_running:
-            self.is_running = False
+            # The scan stays marked as running until the process has exited
+            # and _execution_finished has drained its remaining output
             self.status_var.set("Stopping SQLMap...")
-            # Note: In a real implementation, you would need to kill the process
-            messagebox.showinfo("Info", "Stop functionality would terminate the SQLMap process")
+            self._stop_requested = True
+            asyncio.run_coroutine_threadsafe(self._terminate_process(), self.loop)
+    
+    async def _terminate_process(self):
+        """Terminate the running SQLMap process, killing it after a grace period"""
+        process = self._process
+        if process and process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), TERMINATE_GRACE_PERIOD)
+            except asyncio.TimeoutError:
+                process.kill()
     
     def clear_output(self):
         """Clear output display"""
         self.output_text.delete(1.0, tk.END)
+        self.command_text.configure(state='normal')
         self.command_text.delete(1.0, tk.END)
+        self.command_text.configure(state='disabled')
+        self._display_chunks.clear()
+        self._display_dropped_shown = self._display_dropped
+        with self._output_lock:
+            self._output_log = io.StringIO()
+        self._command_signature = None
         self.status_var.set("🗑️ Output cleared")
         self.progress_var.set("")
     
@@ -799,74 +1097,49 @@ class SQLMapGUI:
                     f.write("SQLMap Command:\n")
                     f.write(self.current_command + "\n\n")
                     f.write("SQLMap Output:\n")
-                    f.write(self.output_text.get(1.0, tk.END))
+                    # Stream the log instead of copying it into one string
+                    with self._output_lock:
+                        self._output_log.seek(0)
+                        try:
+                            shutil.copyfileobj(self._output_log, f)
+                        finally:
+                            self._output_log.seek(0, io.SEEK_END)
                 messagebox.showinfo("Success", f"Output saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save output: {e}")
     
     def load_presets(self):
-        """Load professional presets"""
-        self.presets = {
-            "🚀 Quick Scan": {
-                "risk": "2",
-                "level": "3",
-                "batch": True,
-                "verbose": True,
-                "random_agent": True
-            },
-            "🔍 Comprehensive Scan": {
-                "risk": "3",
-                "level": "5",
-                "threads": "10",
-                "batch": True,
-                "verbose": True,
-                "enum_dbs": True,
-                "enum_tables": True,
-                "enum_columns": True,
-                "random_agent": True
-            },
-            "📊 Database Enumeration": {
-                "risk": "2",
-                "level": "3",
-                "batch": True,
-                "enum_dbs": True,
-                "enum_tables": True,
-                "enum_columns": True,
-                "verbose": True
-            },
-            "💾 Data Extraction": {
-                "risk": "3",
-                "level": "4",
-                "batch": True,
-                "dump_all": True,
-                "verbose": True,
-                "random_agent": True
-            },
-            "🎯 Stealth Mode": {
-                "risk": "1",
-                "level": "2",
-                "delay": "2",
-                "batch": True,
-                "tor": True,
-                "random_agent": True
-            },
-            "⚡ Aggressive Scan": {
-                "risk": "3",
-                "level": "5",
-                "threads": "15",
-                "batch": True,
-                "verbose": True,
-                "enum_dbs": True,
-                "enum_tables": True,
-                "enum_columns": True,
-                "dump_all": True
-            }
-        }
-        
-        # Update preset listbox
+        """Load presets from disk, falling back to the built-in defaults"""
+        try:
+            with open(PRESETS_FILE, 'rb') as f:
+                presets = _json_loads(f.read())
+        except (OSError, ValueError):
+            presets = None
+        # A valid JSON file holding anything but an object is treated as corrupt
+        self.presets = presets if isinstance(presets, dict) else dict(DEFAULT_PRESETS)
+    
+    def _refresh_preset_list(self):
+        """Update preset listbox from the in-memory presets"""
         self.preset_listbox.delete(0, tk.END)
-        for preset_name in self.presets.keys():
-            self.preset_listbox.insert(tk.END, preset_name)
+        self.preset_listbox.insert(tk.END, *self.presets)
+    
+    def _save_presets(self):
+        """Write a snapshot of the presets to disk on the preset writer thread"""
+        self._preset_writer.submit(self._write_presets, dict(self.presets))
+    
+    def _write_presets(self, presets):
+        """Atomically write presets to disk"""
+        tmp_path = PRESETS_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(presets))
+            os.replace(tmp_path, PRESETS_FILE)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            self.root.after(0, messagebox.showerror, "Error", f"Failed to save presets: {e}")
     
     def load_preset(self):
         """Load selected preset"""
@@ -894,21 +1167,20 @@ class SQLMapGUI:
             return
         
         # Add emoji if not present
-        if not any(ord(char) > 127 for char in preset_name):
+        if preset_name.isascii():
             preset_name = f"⚙️ {preset_name}"
         
-        # Collect current settings
+        # Collect current settings from the option mirror
         preset = {}
-        for attr_name in dir(self):
-            if attr_name.endswith('_var') and hasattr(getattr(self, attr_name), 'get'):
-                var = getattr(self, attr_name)
-                value = var.get()
-                if value:  # Only save non-empty values
-                    key = attr_name[:-4]  # Remove '_var' suffix
-                    preset[key] = value
+        for attr_name, value in self._option_values.items():
+            if value:  # Only save non-empty values
+                key = attr_name[:-4]  # Remove '_var' suffix
+                preset[key] = value
         
+        if preset_name not in self.presets:
+            self.preset_listbox.insert(tk.END, preset_name)
         self.presets[preset_name] = preset
-        self.load_presets()  # Refresh the list
+        self._save_presets()
         self.status_var.set(f"✅ Preset '{preset_name}' saved")
         self.progress_var.set("💾 Saved")
         messagebox.showinfo("Success", f"✅ Preset '{preset_name}' saved successfully!")
@@ -924,7 +1196,8 @@ class SQLMapGUI:
         
         if messagebox.askyesno("🗑️ Confirm Deletion", f"Are you sure you want to delete preset '{preset_name}'?"):
             del self.presets[preset_name]
-            self.load_presets()  # Refresh the list
+            self.preset_listbox.delete(selection[0])
+            self._save_presets()
             self.status_var.set(f"🗑️ Preset '{preset_name}' deleted")
             self.progress_var.set("")
             messagebox.showinfo("Success", f"✅ Preset '{preset_name}' deleted successfully!")